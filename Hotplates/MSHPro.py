@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import Dict, Callable, Union, Optional, Any
+from typing import Dict, Callable, FrozenSet, Union, Optional, Any, Tuple
 
 from . import SerialThreadedDuplex
-from .MSHProCommunication import COMMUNICATION
+from .MSHProCommunication import COMMUNICATION, COMMUNICATIONException
 
+import functools
 import logging
+import threading
+import time
+import weakref
 
 logger = logging.getLogger("Hotplates.MSHPro")
 logger.addHandler(logging.NullHandler())
@@ -14,6 +18,15 @@ class MSHPro:
     """
     Serial communication with a MSHPro hotplate.
 
+    The serial port is closed when the object is garbage collected
+    or at interpreter exit.
+    Use as a context manager to close the serial port on leaving the block:
+
+    .. code-block:: python
+
+        >>> with Hotplates.MSHPro(0) as hp:
+        ...     hp.status()
+
     """
 
     SERIAL_SETTINGS = {
@@ -38,7 +51,33 @@ class MSHPro:
     STIRLIMIT_MIN: int = 100
     """Minimum settable stir speed (rpm)."""
 
+    STATUS_TTL: float = 0.2
+    """
+    Time (s) that a :meth:`status` reading is reused
+    before the hotplate is queried again.
+    Set to 0 to always query the hotplate.
+    """
+
+    # method names for :meth:`text_command`
+    _TEXT_COMMANDS: Dict[str, str] = {
+        "PING": "ping",
+        "STATUS": "status",
+        "OFF": "off",
+        "STIR": "stir",
+        "HEAT": "heat",
+        "MODE": "mode",
+    }
+    # :meth:`text_command` commands that take a value
+    _TEXT_COMMANDS_WITH_VALUE: FrozenSet[str] = frozenset({"STIR", "HEAT", "MODE"})
+    # consecutive failures sending STATUS and INFO together before
+    # they are only sent separately
+    _PIPELINE_MAX_FAILURES: int = 3
+
     __Serial: SerialThreadedDuplex.Serial
+    __status_cache: Optional[Tuple[float, Dict[str, Any]]]
+    __lock: threading.RLock
+    __pipeline_failures: int
+    __is_open: Callable[[], bool]
 
     def __init__(
         self,
@@ -73,9 +112,29 @@ class MSHPro:
         )
         if port is not None:
             self.__Serial.port = SerialThreadedDuplex.port_parser(port)
-
-    def __del__(self) -> None:
-        self.__Serial.close()
+        # close the serial port on garbage collection or at exit
+        # without keeping a reference to self
+        weakref.finalize(self, self.__Serial.close)
+        # newer versions of PySerial
+        if hasattr(self.__Serial, "is_open"):
+            self.__is_open = functools.partial(getattr, self.__Serial, "is_open")
+        # older versions of PySerial
+        elif hasattr(self.__Serial, "isOpen"):
+            self.__is_open = self.__Serial.isOpen
+        # unknown, always try to open
+        else:
+            self.__is_open = bool
+        self.__status_cache = None
+        # commands from different threads must not interleave
+        self.__lock = threading.RLock()
+        # send STATUS and INFO in a single write until shown not to work
+        self.__pipeline_failures = 0
+
+    def __enter__(self) -> MSHPro:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.serial_close()
 
     @property
     def port(self) -> Any:  # Returns a `property` object if not set
@@ -84,14 +143,8 @@ class MSHPro:
 
     def serial_open(self) -> None:
         """Open Serial."""
-        # newer versions of PySerial
-        if hasattr(self.__Serial, "is_open"):
-            if self.__Serial.is_open:
-                return
-        # older versions of PySerial
-        elif hasattr(self.__Serial, "isOpen"):
-            if self.__Serial.isOpen():
-                return
+        if self.__is_open():
+            return
 
         # Try to open port
         self.__Serial.open()
@@ -124,14 +177,49 @@ class MSHPro:
             Dict[str, Any]: ``dict`` with parsed responses.
         """
         d = dict() if d is None else d
-        self.serial_open()
         w_bytes = command.to_bytes(var)
-        logger.debug("Sending bytes: {}.".format(w_bytes.hex()))
-        r_bytes = self.__Serial.write_with_read(w_bytes, size=command.len_rx)
-        logger.debug("Received bytes: {}.".format(r_bytes.hex()))
+        with self.__lock:
+            # setting commands change the hotplate status
+            if command._changes_status:
+                self.__status_cache = None
+            self.serial_open()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending bytes: {}.".format(w_bytes.hex()))
+            r_bytes = self.__Serial.write_with_read(w_bytes, size=command.len_rx)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received bytes: {}.".format(r_bytes.hex()))
         d.update(command.parse_response(r_bytes))
         return d
 
+    def __command_pipeline(self, *commands: COMMUNICATION) -> Dict[str, Any]:
+        """
+        Send several commands that do not need a value in one write
+        and read all of the responses together.
+        The hotplate must answer each command in turn.
+
+        Args:
+            *commands (COMMUNICATION):
+                :mod:`COMMUNICATION` to send.
+
+        Returns:
+            Dict[str, Any]: ``dict`` with parsed responses.
+        """
+        d: Dict[str, Any] = dict()
+        requests = [(command.to_bytes(), command.len_rx) for command in commands]
+        with self.__lock:
+            self.serial_open()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sending bytes: {}.".format(b"".join(w for w, _ in requests).hex())
+                )
+            # frames are joined and sent with a single write
+            r_list = self.__Serial.write_with_read_pipeline(requests)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received bytes: {}.".format(b"".join(r_list).hex()))
+        for command, r_bytes in zip(commands, r_list):
+            d.update(command.parse_response(r_bytes))
+        return d
+
     def ping(self) -> bool:
         """
         Send a ping command.
@@ -160,10 +248,24 @@ class MSHPro:
         """
         return self.__command(COMMUNICATION.INFO)
 
+    def __status_cache_fresh(self) -> Optional[Dict[str, Any]]:
+        """
+        Most recent raw :meth:`status` values
+        if read within :const:`MSHPro.STATUS_TTL` otherwise ``None``.
+        """
+        if self.__status_cache is None:
+            return None
+        timestamp, r = self.__status_cache
+        if time.monotonic() - timestamp < self.STATUS_TTL:
+            return r
+        return None
+
     def status(self, raw_values: bool = False) -> Dict[str, Any]:
         """
         Get hotplate status.
         See also :meth:`._status` and :meth:`._info` for a subset of this data.
+        Values read within :const:`MSHPro.STATUS_TTL` are reused
+        unless a setting has been sent since.
 
         Dictionary keys:
             -   `"success"` (`bool`): ``True`` if command received correctly.
@@ -199,8 +301,13 @@ class MSHPro:
         Returns:
             dict: Dictionary of hotplate information.
         """
-        r = self.__command(COMMUNICATION.STATUS)
-        r = self.__command(COMMUNICATION.INFO, None, r)
+        with self.__lock:
+            cached = self.__status_cache_fresh()
+            if cached is None:
+                r = self.__status_info()
+                self.__status_cache = (time.monotonic(), r.copy())
+            else:
+                r = cached.copy()
         # parse on/off information to set values
         if not raw_values:
             if not r["heat_on"]:
@@ -211,87 +318,132 @@ class MSHPro:
             r["heat_alarm"]
         return r
 
+    def __status_info(self) -> Dict[str, Any]:
+        """
+        Read STATUS and INFO from the hotplate, see :meth:`status`.
+        Both commands are sent together, falling back to separate commands
+        if the hotplate does not respond correctly to this.
+        Commands are only sent separately after
+        :const:`MSHPro._PIPELINE_MAX_FAILURES` consecutive failures.
+        """
+        pipeline_error: Optional[Exception] = None
+        if self.__pipeline_failures < self._PIPELINE_MAX_FAILURES:
+            try:
+                r = self.__command_pipeline(COMMUNICATION.STATUS, COMMUNICATION.INFO)
+                self.__pipeline_failures = 0
+                return r
+            # only retry separately when the hotplate responded,
+            # no response (NoDataException) would time out again
+            except COMMUNICATIONException as e:
+                pipeline_error = e
+        r = self.__command(COMMUNICATION.STATUS)
+        r = self.__command(COMMUNICATION.INFO, None, r)
+        # only count a failure once the hotplate has shown it is responding
+        if pipeline_error is not None:
+            self.__pipeline_failures += 1
+            logger.warning(
+                "STATUS and INFO could not be sent together ({}/{}): {!r}".format(
+                    self.__pipeline_failures,
+                    self._PIPELINE_MAX_FAILURES,
+                    pipeline_error,
+                )
+            )
+        return r
+
     def __off(self, *args: COMMUNICATION) -> None:
         """
         Helper function to turn off.
         """
-        current_status: Dict[str, Any]
-        current_status = self.status()
-
-        command: COMMUNICATION
-        for command in args:
-            name: str
-            name = command.name.lower()
-            # already off
-            if not current_status["{}_on".format(name)]:
-                logger.info("{} {} {}".format(command, "OFF", "Success [already off]"))
-                continue
-            # send current setting to turn off
-            if self.__command(command, current_status["{}_set".format(name)])[
-                "success"
-            ]:
-                logger.info("{} {} {}".format(command, "OFF", "Success"))
-                continue
-            logger.error("{} {} {}".format(command, "OFF", "ERROR!"))
+        with self.__lock:
+            # the status must be known before sending anything:
+            # sending a set value toggles on / off so sending it
+            # blindly could switch on a hotplate that is already off
+            current_status: Dict[str, Any]
+            current_status = self.status()
+
+            command: COMMUNICATION
+            for command in args:
+                # already off
+                if not current_status[command._on_key]:
+                    logger.info(
+                        "{} {} {}".format(command, "OFF", "Success [already off]")
+                    )
+                    continue
+                # send current setting to turn off
+                if self.__command(command, current_status[command._set_key])["success"]:
+                    logger.info("{} {} {}".format(command, "OFF", "Success"))
+                    continue
+                logger.error("{} {} {}".format(command, "OFF", "ERROR!"))
 
     def __setval(self, command: COMMUNICATION, val: Any = None) -> bool:
         """
         Helper function to set values.
         """
-        current_status = self.status(raw_values=True)
-        name = command.name.lower()
-        set_value = current_status["{}_set".format(name)]
-        on_status = current_status["{}_on".format(name)]
+        with self.__lock:
+            # a recent reading is enough to find out nothing needs sending
+            current_status = self.__status_cache_fresh()
+            if current_status is None:
+                current_status = self.status(raw_values=True)
+            set_value = current_status[command._set_key]
+            on_status = current_status[command._on_key]
+
+            # switch on to current value
+            if val is None:
+                val = set_value
+
+            # already at correct value
+            if set_value == val:
+                # already on
+                if on_status:
+                    logger.info(
+                        "{} {} {}".format(
+                            command, val, "Success [already at target value]"
+                        )
+                    )
+                    return True
+                # send same value to turn on
+                if self.__command(command, set_value)["success"]:
+                    logger.info(
+                        "{} {} {}".format(command, val, "Success [switched on]")
+                    )
+                    return True
+                logger.error("{} {} {}".format(command, val, "ERROR!"))
+                return False
+
+            # not at correct value
 
-        # switch on to current value
-        if val is None:
-            val = set_value
+            # send value once to change value
+            # this will also toggle the on / off status
+            if not self.__command(command, val)["success"]:
+                logger.error("{} {} {}".format(command, val, "ERROR!"))
+                return False
 
-        # already at correct value
-        if set_value == val:
-            # already on
-            if on_status:
+            # was not previously on - but now on with correct value
+            if not on_status:
                 logger.info(
-                    "{} {} {}".format(command, val, "Success [already at target value]")
+                    "{} {} {}".format(command, val, "Success [set value, switched on]")
                 )
                 return True
-            # send same value to turn on
-            if self.__command(command, set_value)["success"]:
-                logger.info("{} {} {}".format(command, val, "Success [switched on]"))
-                return True
-            logger.error("{} {} {}".format(command, val, "ERROR!"))
-            return False
 
-        # not at correct value
+            # send value a second time to turn back on
+            if self.__command(command, val)["success"]:
+                logger.info(
+                    "{} {} {}".format(
+                        command, val, "Success [switched off, set value, switched on]"
+                    )
+                )
+                return True
 
-        # send value once to change value
-        # this will also toggle the on / off status
-        if not self.__command(command, val)["success"]:
             logger.error("{} {} {}".format(command, val, "ERROR!"))
             return False
 
-        # was not previously on - but now on with correct value
-        if not on_status:
-            logger.info(
-                "{} {} {}".format(command, val, "Success [set value, switched on]")
-            )
-            return True
-
-        # send value a second time to turn back on
-        if self.__command(command, val)["success"]:
-            logger.info(
-                "{} {} {}".format(
-                    command, val, "Success [switched off, set value, switched on]"
-                )
-            )
-            return True
-
-        logger.error("{} {} {}".format(command, val, "ERROR!"))
-        return False
-
     def off(self) -> None:
         """
         Turn off stirring and heating.
+
+        The hotplate status is read first
+        (reusing a reading within :const:`MSHPro.STATUS_TTL`)
+        and only functions that are on are toggled off.
         """
         self.__off(COMMUNICATION.HEAT, COMMUNICATION.STIR)
 
@@ -323,6 +475,9 @@ class MSHPro:
                         val, self.HEATLIMIT_MIN, self.HEATLIMIT_MAX
                     )
                 )
+            # round down to the 0.1 °C resolution of the hotplate
+            # so that the current setting is recognised
+            val = int(val * 10) / 10.0
             self.__setval(COMMUNICATION.HEAT, val)
         except Exception as e:
             self.heat_off()
@@ -376,9 +531,15 @@ class MSHPro:
             mode ({"A", "B", "C"}): Choose mode A, B or C.
         """
         target_mode = "ABC".index(mode)
-        set_mode = "ABC".index(self._info()["mode"])
-        for _ in range((3 + target_mode - set_mode) % 3):
-            self.__command(COMMUNICATION._MODE)
+        with self.__lock:
+            # the command can only step through the modes
+            # so the current mode is needed, a recent reading is enough
+            current_status = self.__status_cache_fresh()
+            if current_status is None:
+                current_status = self._info()
+            set_mode = "ABC".index(current_status["mode"])
+            for _ in range((3 + target_mode - set_mode) % 3):
+                self.__command(COMMUNICATION._MODE)
 
     def text_command(self, cmd: str) -> Any:
         """
@@ -402,21 +563,12 @@ class MSHPro:
             >>> hp.text_command("PING")
             >>> hp.text_command("OFF")
         """
-
-        cmd_dict: Dict[str, Callable]  # type: ignore
-        cmd_dict = {
-            "PING": self.ping,
-            "STATUS": self.status,
-            "OFF": self.off,
-            "STIR": self.stir,
-            "HEAT": self.heat,
-            "MODE": self.mode,
-        }
         cmds = str(cmd).upper().split()
-        if cmds[0] not in cmd_dict:
+        if cmds[0] not in self._TEXT_COMMANDS:
             raise ValueError("Could not find command: {}".format(cmd))
-        if cmds[0] in {"STIR", "HEAT", "MODE"}:
+        method: Callable = getattr(self, self._TEXT_COMMANDS[cmds[0]])  # type: ignore
+        if cmds[0] in self._TEXT_COMMANDS_WITH_VALUE:
             if cmds[1] == "OFF":
-                return cmd_dict[cmds[0]](False)
-            return cmd_dict[cmds[0]](cmds[1])
-        return cmd_dict[cmds[0]]()
+                return method(False)
+            return method(cmds[1])
+        return method()
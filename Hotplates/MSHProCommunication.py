@@ -1,7 +1,15 @@
 from __future__ import annotations
-from typing import Dict, Iterable, Optional, Any
+from typing import Callable, Dict, Iterable, Optional, Any
 
 import enum
+import struct
+
+# data layouts of INFO and STATUS responses (big-endian) starting after
+# the received data flag and data type flag
+_INFO_STRUCT = struct.Struct(">BBBHB")
+_STATUS_STRUCT = struct.Struct(">HHHH")
+# transmitted frame: start flag, command, unsigned 2 byte value, 0x00, checksum
+_TX_STRUCT = struct.Struct(">BBHBB")
 
 
 class COMMUNICATION(enum.Enum):
@@ -77,14 +85,40 @@ class COMMUNICATION(enum.Enum):
     # 0xB5
     # 0xB7
 
+    def __init__(self, value: int) -> None:
+        # commands without a value always send the same bytes
+        # so generate them once here rather than on every send
+        self._tx_const: Optional[bytes] = None
+        if value in {0xA0, 0xA1, 0xA2, 0xB3}:
+            self._tx_const = bytes((0xFE, value, 0x00, 0x00, 0x00, value))
+
+        # response length and parser are also fixed for each command
+        self._len_rx: int = 6
+        self._rx_parse: Callable[[bytes], Dict[str, Any]] = self._parse_ack
+        if value == 0xA1:
+            self._len_rx = 11
+            self._rx_parse = self._parse_info
+        elif value == 0xA2:
+            self._len_rx = 11
+            self._rx_parse = self._parse_status
+
+        # keys of :meth:`.MSHPro.status` values changed by setting commands
+        self._set_key: str = ""
+        self._on_key: str = ""
+        if value == 0xB1:
+            self._set_key, self._on_key = "stir_set", "stir_on"
+        elif value == 0xB2:
+            self._set_key, self._on_key = "heat_set", "heat_on"
+
+        # setting commands change the hotplate status
+        self._changes_status: bool = value in {0xB1, 0xB2, 0xB3}
+
     @property
     def len_rx(self) -> int:
         """
         Length of expected response.
         """
-        if self in {COMMUNICATION.INFO, COMMUNICATION.STATUS}:
-            return 11
-        return 6
+        return self._len_rx
 
     def to_bytes(self, val: Optional[Any] = None) -> bytes:
         """
@@ -103,28 +137,21 @@ class COMMUNICATION(enum.Enum):
                 When :attr:`val` is incorectly formatted
                 or outside of allowed range.
         """
-        if self == COMMUNICATION.PING:
-            return b"\xfe\xa0\x00\x00\x00\xa0"
-
-        if self == COMMUNICATION.INFO:
-            return b"\xfe\xa1\x00\x00\x00\xa1"
-
-        if self == COMMUNICATION.STATUS:
-            return b"\xfe\xa2\x00\x00\x00\xa2"
-
-        if self == COMMUNICATION._MODE:
-            return b"\xfe\xb3\x00\x00\x00\xb3"
+        # PING, INFO, STATUS and _MODE
+        tx_const = self._tx_const
+        if tx_const is not None:
+            return tx_const
 
         # need a value
         if val is None:
             raise ValueError("Please supply value.")
 
         # Format value and check within limits
-        if self == COMMUNICATION.STIR:
+        if self is COMMUNICATION.STIR:
             val = int(val)
 
         # Format value and check within limits
-        if self == COMMUNICATION.HEAT:
+        elif self is COMMUNICATION.HEAT:
             # Temperature setting in 0.1 degree increments
             # multiplied by 10 to convert to int
             val = int(float(val) * 10)
@@ -133,15 +160,15 @@ class COMMUNICATION(enum.Enum):
         if not 0 <= val <= 65535:
             raise ValueError("Value outside maximum range.")
 
-        # Encode value and perform checksum
-        encoded_value: bytes = bytes((self.value, (val >> 8) & 0xFF, val & 0xFF))
-        return bytes(
-            (
-                0xFE,
-                *encoded_value,
-                0x00,
-                checksum(encoded_value),
-            )
+        # Encode value and perform checksum of command and value bytes
+        # (_value_ is a plain attribute, value is a descriptor)
+        cmd: int = self._value_
+        return _TX_STRUCT.pack(
+            0xFE,
+            cmd,
+            val,
+            0x00,
+            (cmd + (val >> 8) + (val & 0xFF)) & 0xFF,
         )
 
     def parse_response(self, b: bytes) -> Dict[str, Any]:
@@ -167,70 +194,83 @@ class COMMUNICATION(enum.Enum):
             ResponseParseException: if there was a problem parsing data.
 
         """
-        response: Dict[str, Any]
-        response = {"success": False}
-
         # check response format
-        if len(b) < self.len_rx:  # length check
+        if len(b) < self._len_rx:  # length check
             raise IncompleteResponseException()
         if not (
             b[0] == 0xFD  # received data flag
-            and b[1] == self.value  # received data type flag
-            and b[-1] == checksum(b[1:-1])  # checksum
+            and b[1] == self._value_  # received data type flag
+            # checksum, slicing a memoryview avoids copying the frame
+            and b[-1] == checksum(memoryview(b)[1:-1])
         ):
             raise ResponseFormatException(
                 "Command {}, invalid response: {!r}".format(self, b)
             )
 
-        # checks are complete so only need the data part of the reply
+        # checks are complete so parse the data part of the reply
+        return self._rx_parse(b)
+
+    def _parse_ack(self, b: bytes) -> Dict[str, Any]:
+        """
+        Parse response data for PING, STIR, HEAT and _MODE.
+        See :meth:`parse_response`.
+        """
         b_data = b[2:-1]
+        # expected response on success
+        if b_data == b"\x00\x00\x00":
+            return {"success": True}
+        # expected response on failure
+        # not for PING - can't really fail at hotplate
+        if b_data == b"\x01\x00\x00" and self is not COMMUNICATION.PING:
+            raise HotplateException("Hotplate error with command: {}".format(self))
+        # error in received data
+        raise ResponseParseException(
+            "Command {}, invalid response: {!r}".format(self, b)
+        )
 
-        # these commands have similar response structure
-        if self in {
-            COMMUNICATION.PING,
-            COMMUNICATION.STIR,
-            COMMUNICATION.HEAT,
-            COMMUNICATION._MODE,
-        }:
-            # expected response on success
-            if b_data == b"\x00\x00\x00":
-                response["success"] = True
-            # expected response on failure
-            # not for PING - can't really fail at hotplate
-            elif b_data == b"\x01\x00\x00" and not self == COMMUNICATION.PING:
-                raise HotplateException("Hotplate error with command: {}".format(self))
-            # error in received data
-            else:
-                raise ResponseParseException(
-                    "Command {}, invalid response: {!r}".format(self, b)
-                )
-
-        if self == COMMUNICATION.INFO:
-            try:
-                response["mode"] = "_ABC"[b_data[0]]  # mode is 1=A, 2=B, 3=C
-                response["stir_on"] = not b_data[1]
-                response["heat_on"] = not b_data[2]
-                response["heat_limit"] = float((b_data[3] << 8) + b_data[4]) / 10.0
-                response["heat_alarm"] = not b_data[5]
-                response["success"] = True
-            except Exception:
-                raise ResponseParseException(
-                    "Command {}, invalid response: {!r}".format(self, b)
-                )
-
-        if self == COMMUNICATION.STATUS:
-            try:
-                # could use int.from_bytes(b_data[0:2], byteorder="big") but same speed
-                response["stir_set"] = int((b_data[0] << 8) + b_data[1])
-                response["stir_actual"] = int((b_data[2] << 8) + b_data[3])
-                response["heat_set"] = float((b_data[4] << 8) + b_data[5]) / 10.0
-                response["heat_actual"] = float((b_data[6] << 8) + b_data[7]) / 10.0
-                response["success"] = True
-            except Exception:
-                raise ResponseParseException(
-                    "Command {}, invalid response: {!r}".format(self, b)
-                )
+    def _parse_info(self, b: bytes) -> Dict[str, Any]:
+        """
+        Parse response data for INFO.
+        See :meth:`parse_response`.
+        """
+        response: Dict[str, Any]
+        response = {"success": False}
+        try:
+            mode, stir_off, heat_off, heat_limit, heat_alarm = _INFO_STRUCT.unpack_from(
+                b, 2
+            )
+            response["mode"] = "_ABC"[mode]  # mode is 1=A, 2=B, 3=C
+            response["stir_on"] = not stir_off
+            response["heat_on"] = not heat_off
+            response["heat_limit"] = heat_limit / 10.0
+            response["heat_alarm"] = not heat_alarm
+            response["success"] = True
+        except Exception:
+            raise ResponseParseException(
+                "Command {}, invalid response: {!r}".format(self, b)
+            )
+        return response
 
+    def _parse_status(self, b: bytes) -> Dict[str, Any]:
+        """
+        Parse response data for STATUS.
+        See :meth:`parse_response`.
+        """
+        response: Dict[str, Any]
+        response = {"success": False}
+        try:
+            stir_set, stir_actual, heat_set, heat_actual = _STATUS_STRUCT.unpack_from(
+                b, 2
+            )
+            response["stir_set"] = stir_set
+            response["stir_actual"] = stir_actual
+            response["heat_set"] = heat_set / 10.0
+            response["heat_actual"] = heat_actual / 10.0
+            response["success"] = True
+        except Exception:
+            raise ResponseParseException(
+                "Command {}, invalid response: {!r}".format(self, b)
+            )
         return response
 
 
@@ -267,9 +307,7 @@ def checksum(val: Iterable[int] | str) -> int:
     Returns:
         int : 1 byte checksum.
     """
-    checksum_result: int = 0
-    if type(val) is str:
-        val = map(ord, val)
-    for c in val:
-        checksum_result = (checksum_result + int(c)) & 0xFF
-    return checksum_result
+    # discarding overflow once at the end gives the same result
+    if isinstance(val, str):
+        return sum(map(ord, val)) & 0xFF
+    return sum(val) & 0xFF
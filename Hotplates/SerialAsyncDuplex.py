@@ -0,0 +1,301 @@
+from __future__ import annotations
+from typing import Any, Callable, Coroutine, Optional, TypeVar, Union
+
+import asyncio
+
+import serial  # type: ignore
+
+try:
+    import serial_asyncio_fast  # type: ignore
+except ImportError:  # optional dependency
+    serial_asyncio_fast = None  # type: ignore
+
+try:
+    import uvloop  # type: ignore
+except ImportError:  # optional dependency, not available on Windows
+    uvloop = None  # type: ignore
+
+from .SerialThreadedDuplex import NoDataException
+
+_T = TypeVar("_T")
+
+
+def run(main: Coroutine[Any, Any, _T]) -> _T:
+    """
+    Run a coroutine using :func:`asyncio.run`.
+    If :mod:`uvloop` (0.18 or later) is installed its faster event loop is used.
+
+    Args:
+        main (Coroutine): coroutine to run.
+
+    Returns:
+        Any: result of the coroutine.
+    """
+    # uvloop.run was added in uvloop 0.18
+    if uvloop is not None and hasattr(uvloop, "run"):
+        return uvloop.run(main)
+    return asyncio.run(main)
+
+
+class _DuplexProtocol(asyncio.Protocol):
+    """
+    Collects received bytes for :class:`Serial`
+    and wakes a read waiting for more bytes.
+    """
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self.__waiter: Optional[asyncio.Future[None]] = None
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        waiter = self.__waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self.closed.done():
+            self.closed.set_result(None)
+        waiter = self.__waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(serial.SerialException("Port closed"))
+
+    async def wait(self) -> None:
+        """Wait until more bytes are received."""
+        if self.closed.done():
+            raise serial.SerialException("Port closed")
+        self.__waiter = asyncio.get_running_loop().create_future()
+        try:
+            await self.__waiter
+        finally:
+            self.__waiter = None
+
+
+class Serial:
+    """
+    Full duplex serial communication using :mod:`asyncio`
+    with :mod:`serial_asyncio_fast`.
+    Writing is eager and the response is collected by the event loop
+    so no thread is needed for each write with read.
+    As :class:`.SerialThreadedDuplex.Serial`, any received bytes
+    are discarded before writing.
+    Concurrent calls on one port wait for each other to complete.
+    Many ports can share one event loop.
+
+    Requires the optional dependency ``pyserial-asyncio-fast``,
+    `i.e.` ``pip install Hotplates[asyncio]``.
+    Use :func:`run` to run with the :mod:`uvloop` event loop where available.
+
+    Example usage:
+
+    .. code-block:: python
+
+        >>> import Hotplates.SerialAsyncDuplex
+        >>> async def main():
+        ...     async with Hotplates.SerialAsyncDuplex.Serial(
+        ...         "/dev/ttyUSB0", timeout=1.0
+        ...     ) as s:
+        ...         return await s.write_with_read_until(b"Hello!", expected=b"\\n")
+        >>> Hotplates.SerialAsyncDuplex.run(main())
+        # received bytes
+
+    """
+
+    def __init__(
+        self,
+        port: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        The serial port will not be opened upon creation.
+
+        Args:
+            port (str): Serial port name.
+            timeout (float, optional):
+                Time limit for reading (s).
+                Defaults to ``None`` that waits indefinitely.
+            **kwargs:
+                Remaining paramaters are passed to PySerial's
+                :mod:`serial.Serial` when the port is opened.
+        """
+        self.port = port
+        self.timeout = timeout
+        self.__kwargs = kwargs
+        self.__transport: Optional[asyncio.Transport] = None
+        self.__protocol: Optional[_DuplexProtocol] = None
+        self.__lock: Optional[asyncio.Lock] = None
+
+    @property
+    def is_open(self) -> bool:
+        """``True`` if the port is open."""
+        return self.__protocol is not None and not self.__protocol.closed.done()
+
+    async def open(self) -> None:
+        """
+        Open the port.
+
+        Raises:
+            ImportError: If ``pyserial-asyncio-fast`` is not installed.
+        """
+        if serial_asyncio_fast is None:
+            raise ImportError(
+                "pyserial-asyncio-fast is required, "
+                "install with: pip install Hotplates[asyncio]"
+            )
+        protocol = _DuplexProtocol()
+        self.__transport, _ = await serial_asyncio_fast.create_serial_connection(
+            asyncio.get_running_loop(), lambda: protocol, self.port, **self.__kwargs
+        )
+        self.__protocol = protocol
+        # created here to use the running event loop
+        self.__lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Close the port."""
+        if self.__transport is None or self.__protocol is None:
+            return
+        transport, protocol = self.__transport, self.__protocol
+        self.__transport = None
+        self.__protocol = None
+        transport.close()
+        await protocol.closed
+
+    async def __aenter__(self) -> Serial:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def __write_with_coroutine(
+        self,
+        data: bytes,
+        size: Optional[int],
+        read: Callable[..., Coroutine[Any, Any, bytes]],
+        *args: Any,
+    ) -> bytes:
+        if self.__lock is None:
+            raise serial.SerialException("Attempting to use a port that is not open")
+        # responses share the receive buffer so only one write with read
+        # can run at a time, as SerialThreadedDuplex.Serial
+        async with self.__lock:
+            # the port could be closed while waiting
+            if self.__transport is None or self.__protocol is None:
+                raise serial.SerialException(
+                    "Attempting to use a port that is not open"
+                )
+            protocol = self.__protocol
+            # the transport releases the port when the connection is lost
+            port = self.__transport.serial  # type: ignore
+            if port is None or protocol.closed.done():
+                raise serial.SerialException("Port closed")
+            # discard stale input, e.g. a late response after a timeout,
+            # as SerialThreadedDuplex.Serial resets the input buffer before writing
+            port.reset_input_buffer()
+            protocol.buffer.clear()
+            # eager write, no need to wait for drain with short messages,
+            # the response is buffered by the event loop until read
+            self.__transport.write(data)
+            try:
+                value = await asyncio.wait_for(read(*args), self.timeout)
+            except asyncio.TimeoutError:
+                # bytes received so far, as serial.Serial.read on timeout
+                buf = protocol.buffer
+                value = bytes(buf if size is None else buf[:size])
+                buf.clear()
+        if not value:
+            raise NoDataException("No received data.")
+        return value
+
+    async def __read_until(
+        self,
+        expected: bytes,
+        size: Optional[int],
+    ) -> bytes:
+        assert self.__protocol is not None
+        protocol = self.__protocol
+        buf = protocol.buffer
+        start = 0
+        while True:
+            # stop after size bytes like serial.Serial.read_until
+            i = buf.find(expected, start)
+            if i >= 0 and (size is None or i + len(expected) <= size):
+                end = i + len(expected)
+                break
+            if size is not None and len(buf) >= size:
+                end = size
+                break
+            # only search new bytes and a possible partial terminator
+            start = max(0, len(buf) - len(expected) + 1)
+            await protocol.wait()
+        value = bytes(buf[:end])
+        del buf[:end]
+        return value
+
+    async def __read(self, size: int) -> bytes:
+        assert self.__protocol is not None
+        protocol = self.__protocol
+        buf = protocol.buffer
+        while len(buf) < size:
+            await protocol.wait()
+        value = bytes(buf[:size])
+        del buf[:size]
+        return value
+
+    async def write_with_read_until(
+        self,
+        data: bytes,
+        *,
+        expected: Union[bytes, str] = b"\n",
+        size: Optional[int] = None,
+    ) -> bytes:
+        """
+        Write data to the serial port
+        while reading until :attr:`expected` is received.
+        Any bytes received after :attr:`expected` are discarded.
+
+        Args:
+            data (bytes): data to write.
+            expected (bytes | str, optional):
+                terminator to read until.
+                Defaults to b"\\\\n".
+            size (int, optional):
+                maximum number of bytes to read.
+                Defaults to ``None``.
+
+        Raises:
+            NoDataException: If there is no data, `i.e.` device timeout.
+            serial.SerialException: If the port is not open or is closed.
+
+        Returns:
+            bytes: received bytes, without :attr:`expected` on timeout.
+        """
+        if isinstance(expected, str):
+            expected = expected.encode()
+        return await self.__write_with_coroutine(
+            data, size, self.__read_until, expected, size
+        )
+
+    async def write_with_read(
+        self,
+        data: bytes,
+        size: int = 1,
+    ) -> bytes:
+        """
+        Write data to the serial port
+        while reading :attr:`size` bytes.
+
+        Args:
+            data (bytes): data to write.
+            size (int, optional): number of bytes to read.
+
+        Raises:
+            NoDataException: If there is no data, `i.e.` device timeout.
+            serial.SerialException: If the port is not open or is closed.
+
+        Returns:
+            bytes: received bytes, fewer than :attr:`size` on timeout.
+        """
+        return await self.__write_with_coroutine(data, size, self.__read, size)
@@ -1,18 +1,43 @@
 from __future__ import annotations
-from typing import Any, Optional, Callable
+from typing import Any, Dict, Iterable, List, Optional, Callable, Tuple, Union
 
+import functools
+import queue
+import select
 import threading
+import time
 import sys
 import os
 
 import serial  # type: ignore
 
+# format of a port name from its number on the current os
+_PORT_FORMAT: Callable[[int], str]
+if sys.platform.startswith("win"):
+    _PORT_FORMAT = "COM{}".format
+else:
+    _PORT_FORMAT = "/dev/ttyUSB{}".format
+
+# interval (s) to check for waiting bytes after a read returns early
+# on ports without a file descriptor for select, `e.g.` on Windows
+_POLL_INTERVAL = 0.001
+
+# read function, args, kwargs and [value, exception] to be filled by the read
+_RxJob = Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any], List[Any]]
+
+
+def _ends_with_partial(buf: bytearray, expected: bytes) -> bool:
+    # True if buf ends with the start of a multi-byte terminator
+    return any(buf.endswith(expected[:i]) for i in range(1, len(expected)))
+
 
 class Serial(serial.Serial):  # type: ignore
     """
     Extending PySerial :mod:`serial.Serial`
     to include full duplex commuication
     using :mod:`threading.Thread`.
+    A single read thread is started on first use and reused for every read
+    until the port is closed.
 
     Example usage:
 
@@ -20,7 +45,7 @@ class Serial(serial.Serial):  # type: ignore
 
         >>> import Hotplates.SerialThreadedDuplex
         >>> s = Hotplates.SerialThreadedDuplex.Serial(port="/dev/ttyUSB0", timeout=1.0)
-        >>> s.write_with_read_until(b"Hello!", expected="\\n")
+        >>> s.write_with_read_until(b"Hello!", expected=b"\\n")
         >>> s.value  
         # received bytes
 
@@ -30,118 +55,437 @@ class Serial(serial.Serial):  # type: ignore
         """
         All paramaters are passed to PySerial's :mod:`serial.Serial`.
         """
-        self.__rx_thread: Optional[threading.Thread] = None
+        self.__rx_worker: Optional[threading.Thread] = None
+        self.__rx_queue: queue.SimpleQueue[Optional[_RxJob]]
+        self.__rx_queue = queue.SimpleQueue()
+        self.__rx_done = threading.Event()
+        self.__rx_done.set()
+        self.__rx_busy = threading.Lock()
+        # set by a read that received a complete response
+        # so no bytes can still be in flight
+        self.__io_clean = False
         self.__rx_value: Optional[bytes] = None
         self.__rx_exception: Optional[Exception] = None
         super().__init__(*args, **kwargs)
 
-    # method passed to threading.Thread for threaded execution
-    def __read_thread(
-        self,
-        fn: Callable[[Any], Any],
-        *args: Any,
-        **kwargs: Any,
+    def close(self) -> None:
+        """
+        Close port and stop the read thread.
+        """
+        super().close()
+        self.__io_clean = False
+        if self.__rx_worker is not None:
+            self.__rx_queue.put(None)
+            self.__rx_worker = None
+
+    # run by the read thread
+    # the Serial is not passed so the thread does not keep it alive
+    @staticmethod
+    def __rx_loop(
+        rx_queue: queue.SimpleQueue[Optional[_RxJob]],
+        rx_done: threading.Event,
     ) -> None:
-        try:
-            self.reset_input_buffer()
-            self.__rx_value = b""
-            self.__rx_value = fn(*args, **kwargs)
-        except Exception as e:
-            self.__rx_value = None
-            self.__rx_exception = e
+        while True:
+            job = rx_queue.get()
+            if job is None:
+                return
+            fn, args, kwargs, result = job
+            try:
+                result[0] = fn(*args, **kwargs)
+            except Exception as e:
+                result[1] = e
+            # release the read function bound to the Serial before waiting
+            del job, fn, args, kwargs, result
+            rx_done.set()
 
     def __write_with_function(
         self,
-        data: bytes,
+        data: Union[bytes, Iterable[bytes]],
         fn: Callable[[Any], Any],
         *args: Any,
         **kwargs: Any,
-    ) -> bytes:
-        # check that previous thread has finished
-        if self.__rx_thread is not None and self.__rx_thread.is_alive():
+    ) -> Any:
+        # check that previous read has finished,
+        # acquiring without blocking is atomic so only one caller can proceed
+        if not self.__rx_busy.acquire(blocking=False):
             raise Exception("Rx thread already started.")
-
         # initialise variables
         self.__rx_value = None
         self.__rx_exception = None
+        # result and exception of fn from the read thread
+        result: List[Any] = [None, None]
         try:
-            # flush
-            self.reset_output_buffer()
-            # setup read thread
-            self.__rx_thread = threading.Thread(
-                target=self.__read_thread, args=(fn,) + args, kwargs=kwargs
-            )
-            self.__rx_thread.start()
+            # join parts so that they are sent with a single write
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                data = b"".join(data)
+            # flush both buffers before starting the read thread
+            # so that the data is written as soon as the thread is started
+            # and a response arriving quickly can not be discarded,
+            # after a complete response only unexpected bytes are flushed
+            if not self.__io_clean:
+                self.reset_output_buffer()
+                self.reset_input_buffer()
+            elif self.in_waiting:
+                self.reset_input_buffer()
+            self.__io_clean = False
+            # start read thread on first use
+            if self.__rx_worker is None:
+                self.__rx_worker = threading.Thread(
+                    target=self.__rx_loop,
+                    args=(self.__rx_queue, self.__rx_done),
+                    daemon=True,
+                )
+                self.__rx_worker.start()
+            # pass read to the read thread
+            self.__rx_done.clear()
+            self.__rx_queue.put((fn, args, kwargs, result))
             # write data
             self.write(data)
-            # join the read thread
-            self.__rx_thread.join()
-        # Catch exception and store in class variable
-        except Exception as e:
-            # join the read thread
-            # self.__rx_thread.join()
-            self.__rx_value = None
+            # wait for the read to complete
+            self.__rx_done.wait()
+            self.__rx_exception = result[1]
+        # Catch port exception and store in class variable,
+        # other exceptions are raised immediately
+        except (serial.SerialException, OSError) as e:
+            self.__io_clean = False
             self.__rx_exception = e
-        # Any exceptions will be raised when value is accessed
-        return self.value
+        finally:
+            # stop and wait for any read left by an exception
+            if not self.__rx_done.is_set():
+                if hasattr(self, "cancel_read"):
+                    self.cancel_read()
+                self.__rx_done.wait()
+                self.__io_clean = False
+            self.__rx_busy.release()
+        # Any exceptions are raised now and when value is accessed
+        self.exception()
+        return result[0]
+
+    def __in_waiting_until(self, deadline: float) -> int:
+        # Number of waiting bytes, waiting until some arrive or deadline.
+        # Used rather than another blocking read after a read returns early
+        # as that could wait for the full port timeout after the deadline.
+        # POSIX ports block in select, other ports are checked periodically.
+        fd: Optional[int] = getattr(self, "fd", None)
+        while True:
+            n = self.in_waiting
+            if n:
+                return n
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return 0
+            if fd is not None:
+                # readable without waiting bytes, `e.g.` hang up,
+                # would return immediately so check periodically instead
+                if select.select([fd], [], [], remaining)[0]:
+                    fd = None
+            else:
+                time.sleep(min(_POLL_INTERVAL, remaining))
+
+    def read_exactly(
+        self,
+        size: int = 1,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Read :attr:`size` bytes using :meth:`serial.Serial.read`.
+        If a read returns early, `e.g.` on :attr:`inter_byte_timeout`,
+        bytes are read as they arrive until :attr:`size` bytes are received
+        or :attr:`timeout` has elapsed, so :attr:`timeout` is an upper bound.
+
+        Args:
+            size (int, optional): number of bytes to read. Defaults to 1.
+            timeout (float, optional):
+                overall time limit (s).
+                Defaults to ``None`` that uses the port :attr:`timeout`.
+
+        Returns:
+            bytes: received bytes, fewer than :attr:`size` on timeout.
+        """
+        port_timeout = self.timeout
+        if timeout is None:
+            timeout = port_timeout
+        # blocking read does not return early
+        if timeout is None:
+            data = self.read(size)
+            self.__io_clean = len(data) == size
+            return data
+        deadline = time.monotonic() + timeout
+        data = b""
+        if port_timeout is not None and port_timeout <= timeout:
+            data = self.read(size)
+        # usually complete after one read so avoid copying into a buffer
+        if len(data) >= size:
+            self.__io_clean = True
+            return data
+        buf = bytearray(data)
+        while len(buf) < size:
+            n = self.__in_waiting_until(deadline)
+            if not n:
+                break
+            buf += self.read(min(n, size - len(buf)))
+        self.__io_clean = len(buf) == size
+        return bytes(buf)
+
+    def read_until_complete(
+        self,
+        expected: bytes | str = b"\n",
+        size: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Read using :meth:`serial.Serial.read_until`.
+        If a read returns early, `e.g.` on :attr:`inter_byte_timeout`,
+        bytes are read as they arrive until :attr:`expected` or :attr:`size`
+        bytes are received or :attr:`timeout` has elapsed,
+        so :attr:`timeout` is an upper bound.
+
+        Args:
+            expected (bytes | str, optional):
+                terminator to read until.
+                Defaults to b"\\\\n".
+            size (int, optional):
+                maximum number of bytes to read.
+                Defaults to ``None``.
+            timeout (float, optional):
+                overall time limit (s).
+                Defaults to ``None`` that uses the port :attr:`timeout`.
+
+        Returns:
+            bytes: received bytes.
+        """
+        if isinstance(expected, str):
+            expected = expected.encode()
+        port_timeout = self.timeout
+        if timeout is None:
+            timeout = port_timeout
+        # blocking read does not return early
+        if timeout is None:
+            return self.read_until(expected, size)
+        deadline = time.monotonic() + timeout
+        buf = bytearray()
+        # wait for the first byte with a single read,
+        # serial.Serial.read_until makes a new read for every byte
+        if size != 0 and port_timeout is not None and port_timeout <= timeout:
+            buf += self.read(1)
+        while not buf.endswith(expected) and (size is None or len(buf) < size):
+            n = self.__in_waiting_until(deadline)
+            if not n:
+                break
+            if size is not None:
+                n = min(n, size - len(buf))
+            # serial.Serial.read_until only finds expected within one call
+            # so a terminator split between reads is completed byte by byte
+            if _ends_with_partial(buf, expected):
+                n = 1
+            buf += self.read_until(expected, n)
+        return bytes(buf)
+
+    def __readinto_exactly(self, buf: Union[bytearray, memoryview]) -> int:
+        # As read_exactly but filling buf in place,
+        # the view is released so that the caller can resize buf
+        with memoryview(buf) as m, m.cast("B") as view:
+            deadline = None if self.timeout is None else time.monotonic() + self.timeout
+            n: int = self.readinto(view)
+            # blocking read does not return early
+            while n < len(view) and deadline is not None:
+                waiting = self.__in_waiting_until(deadline)
+                if not waiting:
+                    break
+                with view[n : n + waiting] as part:
+                    n += self.readinto(part)
+            self.__io_clean = n == len(view)
+        return n
+
+    def __read_until_waiting(
+        self,
+        expected: bytes,
+        size: Optional[int] = None,
+    ) -> bytes:
+        # As read_until_complete but reading all waiting bytes at once
+        # rather than one byte per read.
+        # Bytes after the terminator are discarded, this is only used
+        # when the input buffer is reset before writing.
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        buf = bytearray()
+        # wait for one byte when none are waiting
+        n = self.in_waiting or 1
+        while size is None or len(buf) < size:
+            if size is not None:
+                n = min(n, size - len(buf))
+            # only search new bytes and a possible partial terminator
+            start = max(0, len(buf) - len(expected) + 1)
+            buf += self.read(n)
+            i = buf.find(expected, start)
+            if i >= 0:
+                # clean unless bytes after the terminator were received
+                self.__io_clean = i + len(expected) == len(buf)
+                del buf[i + len(expected) :]
+                break
+            if deadline is None:
+                n = self.in_waiting or 1
+            else:
+                n = self.__in_waiting_until(deadline)
+                if not n:
+                    break
+        return bytes(buf)
+
+    def __read_pipeline(self, reads: List[Union[int, bytes]]) -> List[bytes]:
+        # Read each response in turn as read_exactly or read_until_complete
+        # that do not discard bytes belonging to the next response.
+        # Later responses can not be aligned after an incomplete response.
+        responses: List[bytes] = []
+        complete = True
+        for read in reads:
+            if not complete:
+                responses.append(b"")
+                continue
+            if isinstance(read, int):
+                r = self.read_exactly(read)
+                complete = len(r) == read
+            else:
+                r = self.read_until_complete(read)
+                complete = r.endswith(read)
+            responses.append(r)
+        self.__io_clean = complete
+        return responses
 
     def write_with_read_until(
         self,
-        data: bytes,
+        data: Union[bytes, Iterable[bytes]],
         *,
-        expected: str = "\n",
+        expected: Union[bytes, str] = b"\n",
         size: Optional[int] = None,
     ) -> bytes:
         """
         Write data to the serial port using :meth:`serial.Serial.write`
-        while reading with :meth:`serial.Serial.read_until`.
+        while reading until :attr:`expected` as :meth:`read_until_complete`.
+        All waiting bytes are read at once and
+        any bytes received after :attr:`expected` are discarded.
 
         Args:
-            data (bytes):
+            data (bytes | Iterable[bytes]):
                 :attr:`data` for :meth:`serial.Serial.write`.
-            expected (str, optional):
-                :attr:`expected` for :meth:`serial.Serial.read_until`.
-                Defaults to "\\\\n".
+                An iterable of parts is joined and sent with a single write.
+            expected (bytes | str, optional):
+                :attr:`expected` for :meth:`read_until_complete`,
+                a ``str`` is encoded before reading.
+                Defaults to b"\\\\n".
             size (int, optional):
-                :attr:`size` for :meth:`serial.Serial.read_until`.
+                :attr:`size` for :meth:`read_until_complete`.
                 Defaults to ``None``.
 
         Returns:
             bytes: received bytes. Also accessable using the :attr:`value` property.
         """
-        return self.__write_with_function(
+        if isinstance(expected, str):
+            expected = expected.encode()
+        self.__rx_value = self.__write_with_function(
             data,
-            self.read_until,
+            self.__read_until_waiting,
             expected=expected,
             size=size,
         )
+        return self.value
 
     def write_with_read(
         self,
-        data: bytes,
+        data: Union[bytes, Iterable[bytes]],
         size: int = 1,
     ) -> bytes:
         """
         Write data to the serial port using :meth:`serial.Serial.write`
-        while reading with :meth:`serial.Serial.read`.
+        while reading with :meth:`read_exactly`.
 
         Args:
-            data (bytes): data for :meth:`serial.Serial.write`.
-            size (int, optional): :attr:`size` for :meth:`serial.Serial.read`.
+            data (bytes | Iterable[bytes]):
+                data for :meth:`serial.Serial.write`.
+                An iterable of parts is joined and sent with a single write.
+            size (int, optional): :attr:`size` for :meth:`read_exactly`.
 
         Returns:
             bytes: received bytes. Also accessable using the :attr:`value` property.
         """
-        return self.__write_with_function(
+        self.__rx_value = self.__write_with_function(
             data,
-            self.read,
+            self.read_exactly,
             size=size,
         )
+        return self.value
+
+    def write_with_readinto(
+        self,
+        data: Union[bytes, Iterable[bytes]],
+        buf: Union[bytearray, memoryview],
+    ) -> int:
+        """
+        Write data to the serial port using :meth:`serial.Serial.write`
+        while reading into :attr:`buf` as :meth:`read_exactly`
+        with ``size = len(buf)``.
+        The buffer is filled in place so it can be reused between calls,
+        received bytes are not stored so :attr:`value` is not set.
+
+        Args:
+            data (bytes | Iterable[bytes]):
+                data for :meth:`serial.Serial.write`.
+                An iterable of parts is joined and sent with a single write.
+            buf (bytearray | memoryview): writable buffer for received bytes.
+
+        Raises:
+            NoDataException: If there is no data, `i.e.` device timeout.
+
+        Returns:
+            int: number of received bytes, fewer than ``len(buf)`` on timeout.
+        """
+        n: int = self.__write_with_function(data, self.__readinto_exactly, buf)
+        if not n:
+            raise NoDataException("No received data.")
+        return n
+
+    def write_with_read_pipeline(
+        self,
+        requests: Iterable[Tuple[bytes, Union[int, bytes, str]]],
+    ) -> List[bytes]:
+        """
+        Write several requests to the serial port
+        with a single :meth:`serial.Serial.write`
+        while reading each response in turn.
+        The device must answer the requests in order.
+
+        Args:
+            requests (Iterable[Tuple[bytes, int | bytes | str]]):
+                pairs of data to write and either the number of bytes to read,
+                as :meth:`read_exactly`, or the terminator to read until,
+                as :meth:`read_until_complete`.
+
+        Raises:
+            NoDataException: If the first response is not received.
+
+        Returns:
+            List[bytes]:
+                received responses in order of :attr:`requests`.
+                Responses after an incomplete response are empty.
+                The :attr:`value` property is all received bytes joined.
+        """
+        data: List[bytes] = []
+        reads: List[Union[int, bytes]] = []
+        for d, read in requests:
+            data.append(d)
+            reads.append(read.encode() if isinstance(read, str) else read)
+        responses: List[bytes] = self.__write_with_function(
+            data, self.__read_pipeline, reads
+        )
+        self.__rx_value = b"".join(responses)
+        # no data when the first response is not received
+        if not responses or not responses[0]:
+            raise NoDataException("No received data.")
+        return responses
 
     @property
     def value(self) -> bytes:
         """
         Most recent received value.
+        Not set by :meth:`write_with_readinto`.
 
         Raises:
             Exception:
@@ -157,8 +501,13 @@ class Serial(serial.Serial):  # type: ignore
         Returns:
             bytes: received value.
         """
+        # received data is only stored without an exception
+        # so the usual case needs a single check
+        value = self.__rx_value
+        if value and not self.__rx_busy.locked():
+            return value
         self.exception()
-        if self.__rx_thread is not None and self.__rx_thread.is_alive():
+        if self.__rx_busy.locked():
             raise ReadingNotCompleteException(
                 "Reading must be complete before accessing value."
             )
@@ -201,19 +550,26 @@ def port_parser(
     Returns:
         str: parsed port name.
     """
+    port = _port_name(port)
+    if check_exists:
+        # stat directly rather than os.path.exists to keep the cause
+        try:
+            os.stat(port)
+        except (OSError, ValueError) as e:
+            raise PortNotFoundException("Port does not exist: {}.".format(port)) from e
+    return port
+
+
+# the name only depends on the port so it is cached,
+# existence is checked on each call as devices can be connected or removed
+@functools.lru_cache(maxsize=32)
+def _port_name(port: int | str) -> str:
     try:
         # if an integer is passed then try to convert
         # it to a str depending on the current os
-        port = int(port)
-        if "win" in sys.platform:
-            port = "COM{}".format(port)
-        else:
-            port = "/dev/ttyUSB{}".format(port)
+        return _PORT_FORMAT(int(port))
     except ValueError:
-        port = str(port)
-    if check_exists and not os.path.exists(port):
-        raise PortNotFoundException("Port does not exist: {}.".format(port))
-    return port
+        return str(port)
 
 
 class SerialException(Exception):
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from typing import Optional
+
+import serial  # type: ignore
+
+try:
+    import tty
+except ImportError:  # not available on Windows
+    tty = None  # type: ignore
+
+try:
+    from Hotplates import SerialAsyncDuplex
+except ImportError:  # optional dependency serial_asyncio_fast
+    SerialAsyncDuplex = None  # type: ignore
+
+
+@unittest.skipIf(SerialAsyncDuplex is None, "requires serial_asyncio_fast")
+@unittest.skipIf(tty is None or not hasattr(os, "openpty"), "requires a pty")
+class TestSerialAsyncDuplex(unittest.TestCase):
+    """Writes with reads on an async port."""
+
+    timeout = 0.5
+
+    def setUp(self) -> None:
+        master, slave = os.openpty()
+        self.master: Optional[int] = master
+        tty.setraw(master)
+        tty.setraw(slave)
+        self.port = os.ttyname(slave)
+        self.slave = slave
+
+    def tearDown(self) -> None:
+        os.close(self.slave)
+        if self.master is not None:
+            os.close(self.master)
+
+    def reply(self, *responses: bytes) -> None:
+        """Send one response from the device side after each write."""
+
+        master = self.master
+        assert master is not None
+
+        def device() -> None:
+            for response in responses:
+                os.read(master, 64)
+                time.sleep(0.05)
+                os.write(master, response)
+
+        threading.Thread(target=device, daemon=True).start()
+
+    def run_with_port(self, *calls):  # type: ignore
+        async def run():  # type: ignore
+            port = SerialAsyncDuplex.Serial(port=self.port, timeout=self.timeout)
+            await port.open()
+            try:
+                return await asyncio.gather(*(call(port) for call in calls))
+            finally:
+                await port.close()
+
+        return asyncio.run(run())
+
+    def test_concurrent_calls(self) -> None:
+        self.reply(b"one\r\n", b"two\r\n")
+        self.assertEqual(
+            self.run_with_port(
+                lambda port: port.write_with_read_until(b"a", expected=b"\r\n"),
+                lambda port: port.write_with_read_until(b"b", expected=b"\r\n"),
+            ),
+            [b"one\r\n", b"two\r\n"],
+        )
+
+    def test_partial_on_timeout(self) -> None:
+        self.reply(b"par")
+        start = time.monotonic()
+        self.assertEqual(
+            self.run_with_port(lambda port: port.write_with_read(b"a", 5)),
+            [b"par"],
+        )
+        self.assertGreaterEqual(time.monotonic() - start, self.timeout)
+
+    def test_connection_lost(self) -> None:
+        async def call(port):  # type: ignore
+            # hang up the device side
+            os.close(self.master)
+            self.master = None
+            await asyncio.sleep(0.1)
+            self.assertFalse(port.is_open)
+            await port.write_with_read(b"a")
+
+        with self.assertRaisesRegex(serial.SerialException, "Port closed"):
+            self.run_with_port(call)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+import unittest
+
+from Hotplates import SerialThreadedDuplex
+
+try:
+    import tty
+except ImportError:  # not available on Windows
+    tty = None  # type: ignore
+
+
+@unittest.skipIf(tty is None or not hasattr(os, "openpty"), "requires a pty")
+class TestSplitTerminator(unittest.TestCase):
+    """Terminators split between reads must not be read past."""
+
+    timeout = 0.5
+
+    def setUp(self) -> None:
+        self.master, slave = os.openpty()
+        tty.setraw(self.master)
+        tty.setraw(slave)
+        self.serial = SerialThreadedDuplex.Serial(
+            port=os.ttyname(slave), timeout=self.timeout
+        )
+        os.close(slave)
+
+    def tearDown(self) -> None:
+        self.serial.close()
+        os.close(self.master)
+
+    def reply(self, *chunks: bytes) -> None:
+        """Send each chunk from the device side after the next write."""
+
+        def device() -> None:
+            os.read(self.master, 64)
+            for chunk in chunks:
+                os.write(self.master, chunk)
+                time.sleep(0.05)
+
+        threading.Thread(target=device, daemon=True).start()
+
+    def test_read_until_complete(self) -> None:
+        self.reply(b"abc\r", b"\nxyz")
+        self.serial.write(b"?")
+        start = time.monotonic()
+        self.assertEqual(self.serial.read_until_complete(b"\r\n"), b"abc\r\n")
+        self.assertLess(time.monotonic() - start, self.timeout)
+        self.assertEqual(self.serial.read_exactly(3), b"xyz")
+
+    def test_write_with_read_pipeline(self) -> None:
+        self.reply(b"one\r", b"\ntwo\r\n")
+        start = time.monotonic()
+        self.assertEqual(
+            self.serial.write_with_read_pipeline([(b"a", b"\r\n"), (b"b", b"\r\n")]),
+            [b"one\r\n", b"two\r\n"],
+        )
+        self.assertLess(time.monotonic() - start, self.timeout)
+
+
+if __name__ == "__main__":
+    unittest.main()